@@ -41,8 +41,8 @@ class Blockchain:
         new_proof = 1
         check_proof = False
         while check_proof is False:
-            hash_operation = hashlib.sha256(str(new_proof**2 - previous_proof**2).encode()).hexdigest()
-            if hash_operation[:4] == '0000':
+            hash_operation = hashlib.sha256(str(new_proof**2 - previous_proof**2).encode()).digest()
+            if hash_operation[0] | hash_operation[1] == 0:                      # Same as hexdigest()[:4] == '0000' without building the hex string
                 check_proof = True
             else:
                 new_proof += 1
@@ -61,8 +61,8 @@ class Blockchain:
                 return False
             previous_proof = previous_block['proof']
             proof = block['proof']
-            hash_operation = hashlib.sha256(str(proof**2 - previous_proof**2).encode()).hexdigest()
-            if hash_operation[:4] != '0000':
+            hash_operation = hashlib.sha256(str(proof**2 - previous_proof**2).encode()).digest()
+            if hash_operation[0] | hash_operation[1] != 0:
                 return False
             previous_block = block
             block_index += 1
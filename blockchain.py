@@ -1,29 +1,144 @@
 # Blockchain with Transactions, Merkle Root & Flask API
 # Test with Postman at http://localhost:5000
+# Production: gunicorn -w 1 -k gthread --threads 4 -b 0.0.0.0:5000 blockchain:app
+# (keep a single worker process: the chain and mempool live in memory)
 
 # Importing the libraries
 import datetime
 import hashlib
 import json
+import os
+import queue
+import ssl
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from flask import Flask, jsonify, request
+from uuid import uuid4
 
 # Part 1 - Building a Blockchain
 
+def _canonical_json(obj):
+    """Serialize obj as key-sorted JSON bytes for hashing.
+
+    The default json.dumps output is ASCII-only, so .encode() cannot fail,
+    even on lone surrogates.
+    """
+    return json.dumps(obj, sort_keys=True).encode()
+
+
+# Empty SHA-256 context; copying it is cheaper than constructing a new one per hash
+_SHA256 = hashlib.sha256()
+
+
+def _sha256(data):
+    """Return a SHA-256 object that has consumed data, cloned from _SHA256."""
+    h = _SHA256.copy()
+    h.update(data)
+    return h
+
+
+def sha256_backend():
+    """Describe the SHA-256 implementation in use and the CPU features it can use.
+
+    OpenSSL picks its own SHA-NI / AVX2 / SSSE3 code path at load time; this only
+    reports what it has to choose from so operators can check, e.g., that SHA-NI
+    is present.
+    """
+    if hashlib.sha256.__name__.startswith('openssl'):
+        backend = ssl.OPENSSL_VERSION
+    else:
+        backend = 'CPython built-in sha256'
+    flags = set()
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('flags'):
+                    flags = set(line.split(':', 1)[1].split())
+                    break
+    except OSError:
+        pass  # Not Linux; CPU flags unknown
+    features = [name for name in ('sha_ni', 'avx512f', 'avx2', 'ssse3') if name in flags]
+    return f"{backend} [{', '.join(features) or 'no SHA/SIMD flags detected'}]"
+
+
+# Nonces tried per call to _search before control returns to proof_of_work
+NONCE_BATCH = 4096
+
+# Worker processes that share the nonce search once the first batch misses
+MINING_WORKERS = os.cpu_count() or 1
+_mining_pool = None
+
+
+def _meets_target(digest):
+    """True if a raw SHA-256 digest starts with three zero hex digits (12 zero bits)."""
+    return digest[0] == 0 and digest[1] < 0x10
+
+
+def _block_prefix(index, timestamp_ns, previous_hash, merkle_root, tx_data):
+    """Bytes of the PoW preimage before the nonce; the one place the field order is written down.
+
+    The preimage is index + timestamp_ns (8 bytes, big-endian) + previous_hash
+    + merkle_root + tx_data + proof. The nonce goes last so mining can reuse
+    the hash state of everything before it.
+    """
+    return (str(index).encode() + timestamp_ns.to_bytes(8, 'big')
+            + (previous_hash + merkle_root).encode() + tx_data)
+
+
+def _block_digest(prefix, proof):
+    """Raw SHA-256 digest of a block whose preimage starts with prefix and ends with proof."""
+    h = _sha256(prefix)
+    h.update(b'%d' % proof)
+    return h.digest()
+
+
+def _search(prefix, start, stop):
+    """Return the first nonce in [start, stop) that solves the PoW, or None.
+
+    The nonce is the last field of the preimage, so the SHA-256 state over
+    the fixed prefix is computed once and copied for every attempt.
+    """
+    base = _sha256(prefix)
+    for nonce in range(start, stop):
+        h = base.copy()
+        h.update(b'%d' % nonce)
+        digest = h.digest()
+        if digest[0] == 0 and digest[1] < 0x10:  # _meets_target, inlined for the hot loop
+            return nonce
+    return None
+
+
+def _get_mining_pool():
+    """Create the mining process pool on first use and reuse it afterwards."""
+    global _mining_pool
+    if _mining_pool is None:
+        _mining_pool = ProcessPoolExecutor(max_workers=MINING_WORKERS)
+    return _mining_pool
+
+
 class Blockchain:
 
     def __init__(self):
         self.chain = []
-        self.transactions = []  # Mempool for pending transactions
+        self.transactions = deque()  # Mempool for pending transactions; append/popleft are thread-safe
+        self._validated_until = 0    # self.chain[:_validated_until] is known to be valid
+        self._validated_hash = None  # block_hash of the last block covered by that checkpoint
 
-    def create_block(self, proof, previous_hash, merkle_root, transactions, timestamp, block_hash):
+    def create_block(self, proof, previous_hash, merkle_root, transactions, timestamp_ns, block_hash, tx_data=None):
+        if tx_data is None:
+            tx_data = _canonical_json(transactions)
         block = {
             'index': len(self.chain) + 1,
-            'timestamp': timestamp,
+            'timestamp': datetime.datetime.fromtimestamp(timestamp_ns / 1e9).isoformat(),  # For display only
+            'timestamp_ns': timestamp_ns,                                                   # Hashed
             'proof': proof,
             'previous_hash': previous_hash,
             'merkle_root': merkle_root,
             'transactions': transactions,
-            'block_hash': block_hash
+            'block_hash': block_hash,
+            '_tx_data': tx_data  # Serialized transactions; blocks are immutable, so validation reuses it
         }
         self.chain.append(block)
         return block
@@ -32,74 +147,90 @@ class Blockchain:
         if not transactions:
             return '0'
 
-        # Hash each transaction as a JSON string
-        temp_transactions = [json.dumps(tx, sort_keys=True) for tx in transactions]
+        # Leaves are the 32-byte digests of each transaction, so every
+        # internal node hashes exactly 64 bytes (left || right)
+        level = [_sha256(_canonical_json(tx)).digest() for tx in transactions]
 
-        while len(temp_transactions) > 1:
-            if len(temp_transactions) % 2 != 0:
-                temp_transactions.append(temp_transactions[-1])
+        while len(level) > 1:
+            # An odd node at the end of a level is paired with itself
+            n = len(level)
+            level = [
+                _sha256(level[i] + level[i + 1 if i + 1 < n else i]).digest()
+                for i in range(0, n, 2)
+            ]
 
-            new_level = []
-            for i in range(0, len(temp_transactions), 2):
-                hash_val = hashlib.sha256(
-                    (temp_transactions[i] + temp_transactions[i + 1]).encode()
-                ).hexdigest()
-                new_level.append(hash_val)
-            temp_transactions = new_level
-
-        return temp_transactions[0]
+        return level[0].hex()
 
     def get_previous_block(self):
         if len(self.chain) == 0:
             return None
         return self.chain[-1]
 
-    def proof_of_work(self, block_index, timestamp, previous_hash, merkle_root, transactions):
-        tx_data = json.dumps(transactions, sort_keys=True)
-        new_proof = 0
-        check_proof = False
-        while check_proof is False:
-            hash_operation = hashlib.sha256(
-                (str(new_proof) + str(block_index) + str(timestamp) + previous_hash + merkle_root + tx_data).encode()
-            ).hexdigest()
-            if hash_operation[:3] == '000':
-                check_proof = True
-            else:
-                new_proof += 1
-        return new_proof
+    def proof_of_work(self, block_index, timestamp_ns, previous_hash, merkle_root, tx_data):
+        """Find the nonce for a block; tx_data is its transactions already serialized by _canonical_json."""
+        # Everything before the nonce is fixed for this block, so build and encode it once
+        prefix = _block_prefix(block_index, timestamp_ns, previous_hash, merkle_root, tx_data)
+        # The first batch solves the 12-bit target about 63% of the time, so
+        # try it here before paying for inter-process hand-off
+        new_proof = _search(prefix, 0, NONCE_BATCH)
+        if new_proof is not None:
+            return new_proof
+
+        # Mining-pool style: each round gives every worker its own disjoint
+        # range of NONCE_BATCH nonces. The lowest hit of a round is the same
+        # nonce a sequential scan would have found.
+        pool = _get_mining_pool()
+        start = NONCE_BATCH
+        while True:
+            futures = [
+                pool.submit(_search, prefix, start + k * NONCE_BATCH, start + (k + 1) * NONCE_BATCH)
+                for k in range(MINING_WORKERS)
+            ]
+            hits = [nonce for nonce in (f.result() for f in futures) if nonce is not None]
+            if hits:
+                return min(hits)
+            start += MINING_WORKERS * NONCE_BATCH
+
+    def compute_block_digest(self, block):
+        """Recompute the raw PoW digest from block fields (see _block_prefix).
+
+        The readable 'timestamp' field is not hashed.
+        """
+        tx_data = block.get('_tx_data') or _canonical_json(block['transactions'])
+        prefix = _block_prefix(block['index'], block['timestamp_ns'], block['previous_hash'], block['merkle_root'],
+                               tx_data)
+        return _block_digest(prefix, block['proof'])
 
     def compute_block_hash(self, block):
-        """Recompute the PoW hash from block fields."""
-        tx_data = json.dumps(block['transactions'], sort_keys=True)
-        return hashlib.sha256(
-            (str(block['proof']) + str(block['index']) + block['timestamp']
-             + block['previous_hash'] + block['merkle_root'] + tx_data).encode()
-        ).hexdigest()
-
-    def is_chain_valid(self, chain):
-        if len(chain) == 0:
-            return True
-
-        # Validate first block: previous_hash must be '0'
-        first_block = chain[0]
-        if first_block['previous_hash'] != '0':
-            return False
-        if self.get_merkle_root(first_block['transactions']) != first_block['merkle_root']:
-            return False
-        # Verify PoW of first block
-        computed_hash = self.compute_block_hash(first_block)
-        if computed_hash[:3] != '000':
-            return False
-        if first_block['block_hash'] != computed_hash:
-            return False
-
-        previous_block = first_block
-        block_index = 1
-        while block_index < len(chain):
+        """Recompute the PoW hash from block fields, hex-encoded."""
+        return self.compute_block_digest(block).hex()
+
+    def is_chain_valid(self, chain, start_index=None):
+        """Validate chain[start_index:], trusting the blocks before it.
+
+        For this node's own chain start_index defaults to the checkpoint left by
+        the last successful call, so only blocks mined since then are rehashed.
+        Any other chain is validated from the first block.
+        """
+        own_chain = chain is self.chain
+        # The miner may append while this runs; only blocks up to end are checked and checkpointed
+        end = len(chain)
+        if start_index is None:
+            start_index = self._validated_until if own_chain else 0
+            # Start over if the checkpointed block is no longer the one that was validated
+            if start_index and (start_index > end
+                                or chain[start_index - 1]['block_hash'] != self._validated_hash):
+                start_index = 0
+
+        for block_index in range(start_index, end):
             block = chain[block_index]
 
+            if block_index == 0:
+                # Validate first block: previous_hash must be '0'
+                if block['previous_hash'] != '0':
+                    return False
             # Verify previous hash link matches previous block's block_hash
-            if block['previous_hash'] != previous_block['block_hash']:
+            elif block['previous_hash'] != chain[block_index - 1]['block_hash']:
                 return False
 
             # Verify Merkle Root
@@ -107,14 +238,15 @@ class Blockchain:
                 return False
 
             # Verify Proof of Work and stored block_hash
-            computed_hash = self.compute_block_hash(block)
-            if computed_hash[:3] != '000':
+            digest = self.compute_block_digest(block)
+            if not _meets_target(digest):
                 return False
-            if block['block_hash'] != computed_hash:
+            if block['block_hash'] != digest.hex():
                 return False
 
-            previous_block = block
-            block_index += 1
+        if own_chain and end:
+            self._validated_until = end
+            self._validated_hash = chain[end - 1]['block_hash']
         return True
 
     def create_transaction(self, sender, receiver, amount):
@@ -128,14 +260,30 @@ class Blockchain:
             return 1
         return previous_block['index'] + 1
 
+    def create_transactions(self, transactions):
+        """Add a batch of transaction dicts to the mempool with a single extend."""
+        # Build the list first so the extend itself never runs Python code and stays atomic
+        self.transactions.extend([
+            {'sender': tx['sender'], 'receiver': tx['receiver'], 'amount': tx['amount']}
+            for tx in transactions
+        ])
+
 
 # Part 2 - Flask API
 
 app = Flask(__name__)
+print(f' * SHA-256 backend: {sha256_backend()}')
 
 # Creating a Blockchain
 blockchain = Blockchain()
 
+# Mining runs on a background thread so /mine_block returns immediately
+mempool_lock = threading.Lock()  # Held only while the miner takes (or returns) a block's transactions
+mining_queue = queue.Queue()     # Job ids waiting to be mined, in request order
+mining_jobs = {}                 # job_id -> status and, once done, the mined block
+finished_jobs = deque()          # Finished job ids, oldest first; only the newest MAX_FINISHED_JOBS are kept
+MAX_FINISHED_JOBS = 1000
+
 # Preload mempool with 5 default transactions
 blockchain.create_transaction('Alice', 'Bob', 50)
 blockchain.create_transaction('Bob', 'Charlie', 30)
@@ -165,28 +313,59 @@ def add_transaction():
     return jsonify(response), 201
 
 
+# POST /add_transactions  — Add a batch of transactions to the mempool
+# Body (JSON): [ { "sender": "Alice", "receiver": "Bob", "amount": 100 }, ... ]
+@app.route('/add_transactions', methods=['POST'])
+def add_transactions():
+    json_data = request.get_json()
+    required_fields = ['sender', 'receiver', 'amount']
+    if not isinstance(json_data, list) or not json_data:
+        return jsonify({'error': 'Body must be a non-empty JSON array of transactions'}), 400
+    for i, tx in enumerate(json_data):
+        if not isinstance(tx, dict) or not all(field in tx for field in required_fields):
+            return jsonify({'error': f'Transaction {i}: missing fields. Required: sender, receiver, amount'}), 400
+
+    blockchain.create_transactions(json_data)
+    response = {
+        'message': f'{len(json_data)} transaction(s) added to mempool',
+        'pending_transactions': len(blockchain.transactions)
+    }
+    return jsonify(response), 201
+
+
 # GET /pending_transactions  — View all pending (unmined) transactions
 @app.route('/pending_transactions', methods=['GET'])
 def pending_transactions():
     response = {
-        'pending_transactions': blockchain.transactions,
+        'pending_transactions': list(blockchain.transactions),
         'count': len(blockchain.transactions)
     }
     return jsonify(response), 200
 
 
-# GET /mine_block  — Mine a new block (requires at least 5 pending transactions)
-@app.route('/mine_block', methods=['GET'])
-def mine_block():
-    if len(blockchain.transactions) < 5:
-        return jsonify({
-            'error': f'Not enough transactions to mine (min 5). Current: {len(blockchain.transactions)}'
-        }), 400
+def mine_pending_block():
+    """Mine the first 5 pending transactions into a new block.
 
+    Returns the new block, or None if fewer than 5 transactions are pending.
+    Only the background miner calls this, so the chain has a single writer.
+    """
     # Take first 5 transactions from the mempool
-    transactions_to_mine = blockchain.transactions[:5]
-    blockchain.transactions = blockchain.transactions[5:]
+    with mempool_lock:
+        if len(blockchain.transactions) < 5:
+            return None
+        transactions_to_mine = [blockchain.transactions.popleft() for _ in range(5)]
+
+    try:
+        return build_block(transactions_to_mine)
+    except Exception:
+        # Return the transactions to the front of the mempool so a failed job loses nothing
+        with mempool_lock:
+            blockchain.transactions.extendleft(reversed(transactions_to_mine))
+        raise
+
 
+def build_block(transactions_to_mine):
+    """Hash, mine and append a block holding transactions_to_mine; returns the block."""
     previous_block = blockchain.get_previous_block()
     if previous_block is None:
         previous_hash = '0'  # First block in the chain
@@ -195,35 +374,99 @@ def mine_block():
     merkle_root = blockchain.get_merkle_root(transactions_to_mine)
 
     block_index = len(blockchain.chain) + 1
-    timestamp = str(datetime.datetime.now())
-    proof = blockchain.proof_of_work(block_index, timestamp, previous_hash, merkle_root, transactions_to_mine)
+    timestamp_ns = time.time_ns()
+    # Serialize the transactions once; the same bytes feed the PoW, the block hash and later revalidation
+    tx_data = _canonical_json(transactions_to_mine)
+    proof = blockchain.proof_of_work(block_index, timestamp_ns, previous_hash, merkle_root, tx_data)
 
     # Compute the PoW block hash (starts with '000')
-    tx_data = json.dumps(transactions_to_mine, sort_keys=True)
-    block_hash = hashlib.sha256(
-        (str(proof) + str(block_index) + timestamp + previous_hash + merkle_root + tx_data).encode()
-    ).hexdigest()
+    prefix = _block_prefix(block_index, timestamp_ns, previous_hash, merkle_root, tx_data)
+    block_hash = _block_digest(prefix, proof).hex()
+
+    return blockchain.create_block(proof, previous_hash, merkle_root, transactions_to_mine, timestamp_ns, block_hash,
+                                  tx_data=tx_data)
+
+
+def finish_job(job_id, result):
+    """Record a job's final result and forget the oldest finished job once over MAX_FINISHED_JOBS."""
+    mining_jobs[job_id] = result
+    finished_jobs.append(job_id)
+    if len(finished_jobs) > MAX_FINISHED_JOBS:
+        del mining_jobs[finished_jobs.popleft()]
+
+
+def mining_worker():
+    """Background thread: mine one block per queued job and record the outcome."""
+    while True:
+        job_id = mining_queue.get()
+        mining_jobs[job_id] = {'status': 'mining'}
+        try:
+            block = mine_pending_block()
+        except Exception as e:
+            finish_job(job_id, {'status': 'failed', 'error': str(e)})
+            continue
+        if block is None:
+            finish_job(job_id, {
+                'status': 'failed',
+                'error': 'Not enough transactions to mine (min 5) when the job started.'
+            })
+            continue
+        finish_job(job_id, {
+            'status': 'done',
+            'message': 'Congratulations, you just mined a block!',
+            'index': block['index'],
+            'timestamp': block['timestamp'],
+            'timestamp_ns': block['timestamp_ns'],
+            'nonce': block['proof'],
+            'previous_hash': block['previous_hash'],
+            'merkle_root': block['merkle_root'],
+            'block_hash': block['block_hash'],
+            'transactions': block['transactions']
+        })
+
 
-    block = blockchain.create_block(proof, previous_hash, merkle_root, transactions_to_mine, timestamp, block_hash)
+threading.Thread(target=mining_worker, daemon=True).start()
 
+
+# GET /mine_block  — Queue a mining job (requires at least 5 pending transactions)
+# Returns 202 with a job_id; poll /mine_status/<job_id> for the mined block
+@app.route('/mine_block', methods=['GET'])
+def mine_block():
+    if len(blockchain.transactions) < 5:
+        return jsonify({
+            'error': f'Not enough transactions to mine (min 5). Current: {len(blockchain.transactions)}'
+        }), 400
+
+    job_id = uuid4().hex
+    mining_jobs[job_id] = {'status': 'queued'}
+    mining_queue.put(job_id)
     response = {
-        'message': 'Congratulations, you just mined a block!',
-        'index': block['index'],
-        'timestamp': block['timestamp'],
-        'nonce': block['proof'],
-        'previous_hash': block['previous_hash'],
-        'merkle_root': block['merkle_root'],
-        'block_hash': block['block_hash'],
-        'transactions': block['transactions']
+        'message': 'Mining job queued',
+        'job_id': job_id,
+        'status_url': f'/mine_status/{job_id}'
     }
-    return jsonify(response), 200
+    return jsonify(response), 202
+
+
+# GET /mine_status/<job_id>  — Status of a mining job; includes the block once done
+@app.route('/mine_status/<job_id>', methods=['GET'])
+def mine_status(job_id):
+    job = mining_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': f'Unknown mining job: {job_id}'}), 404
+    return jsonify({'job_id': job_id, **job}), 200
+
+
+def public_block(block):
+    """Copy of block without the internal '_'-prefixed fields, for API responses."""
+    return {key: value for key, value in block.items() if not key.startswith('_')}
 
 
 # GET /get_chain  — Get the full blockchain
 @app.route('/get_chain', methods=['GET'])
 def get_chain():
     response = {
-        'chain': blockchain.chain,
+        'chain': [public_block(block) for block in blockchain.chain],
         'length': len(blockchain.chain)
     }
     return jsonify(response), 200
@@ -242,4 +485,4 @@ def is_valid():
 
 # Running the app
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=True, threaded=True)
@@ -1,154 +1,356 @@
 # Cryptocurrency Node - Port 5002
 # Run 3 nodes (5001, 5002, 5003) in separate terminals
 # Use Postman to connect nodes, add transactions, mine blocks, and sync chains
+# Production: gunicorn -w 1 -k gthread --threads 4 -b 0.0.0.0:5002 hadcoin_node_5002:app
+# (keep a single worker process: the chain and mempool live in memory)
 
 # Importing the libraries
 import datetime
 import hashlib
+import itertools
 import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from flask import Flask, jsonify, request
 import requests
+from requests.adapters import HTTPAdapter
 from uuid import uuid4
 from urllib.parse import urlparse
 
 # Part 1 - Building the Blockchain
 
+def _canonical_json(obj):
+    """Serialize obj as key-sorted JSON bytes for hashing and mempool keys.
+
+    The default json.dumps output is ASCII-only, so .encode() cannot fail,
+    even on lone surrogates.
+    """
+    return json.dumps(obj, sort_keys=True).encode()
+
+
+# Nonces in one work unit handed to _search
+NONCE_BATCH = 4096
+
+# Worker processes that share the nonce search once the first work unit misses
+MINING_WORKERS = os.cpu_count() or 1
+_mining_pool = None
+
+
+def _meets_target(digest):
+    """True if a raw SHA-256 digest starts with three zero hex digits (12 zero bits)."""
+    return digest[0] == 0 and digest[1] < 0x10
+
+
+def _block_prefix_parts(index, timestamp_ns, previous_hash, merkle_root, tx_data):
+    """Byte fields of the PoW preimage before the nonce, in hashing order.
+
+    This is the only place the field order is written down. The preimage is
+    index + timestamp_ns (8 bytes, big-endian) + previous_hash + merkle_root
+    + tx_data + proof.
+    """
+    return (b'%d' % index, timestamp_ns.to_bytes(8, 'big'), previous_hash.encode(), merkle_root.encode(), tx_data)
+
+
+def _block_hasher(index, timestamp_ns, previous_hash, merkle_root, tx_data):
+    """SHA-256 state after every preimage field except the trailing nonce.
+
+    Fields are fed with update() one by one, so tx_data is hashed in place
+    rather than copied into a concatenated preimage first.
+    """
+    h = hashlib.sha256()
+    for part in _block_prefix_parts(index, timestamp_ns, previous_hash, merkle_root, tx_data):
+        h.update(part)
+    return h
+
+
+def _search(prefix, start, stop):
+    """Return the first nonce in [start, stop) that solves the PoW, or None.
+
+    Module-level so it can be sent to the mining pool. The SHA-256 state of
+    the fixed prefix is computed once per work unit and copied per attempt.
+    """
+    base = hashlib.sha256(prefix)
+    for nonce in range(start, stop):
+        h = base.copy()
+        h.update(b'%d' % nonce)
+        digest = h.digest()
+        if digest[0] == 0 and digest[1] < 0x10:                                # _meets_target, inlined for the hot loop
+            return nonce
+    return None
+
+
+# Shared plumbing for peer calls: keep-alive connections reused across requests,
+# and a thread pool so all peers are contacted at once instead of one by one
+PEER_SESSION = requests.Session()
+PEER_SESSION.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+PEER_EXECUTOR = ThreadPoolExecutor(max_workers=16)
+PEER_TIMEOUT = (1, 3)                                                           # (connect, read) seconds
+
+
+def _post_to_peer(node, path, payload):
+    """POST payload to one peer; returns the response, or None if the peer is unreachable."""
+    try:
+        return PEER_SESSION.post(f'http://{node}{path}', json=payload, timeout=PEER_TIMEOUT)
+    except requests.exceptions.RequestException:
+        return None
+
+
+def _get_from_peer(node, path):
+    """GET path from one peer and parse the JSON object it returns; None if the peer is unreachable or errors."""
+    try:
+        response = PEER_SESSION.get(f'http://{node}{path}', timeout=PEER_TIMEOUT)
+        if response.status_code != 200:
+            return None
+        data = response.json()
+    except (requests.exceptions.RequestException, ValueError):                 # ValueError: body is not JSON on older requests
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _get_mining_pool():
+    """Create the mining process pool on first use and reuse it afterwards."""
+    global _mining_pool
+    if _mining_pool is None:
+        _mining_pool = ProcessPoolExecutor(max_workers=MINING_WORKERS)
+    return _mining_pool
+
+
 class Blockchain:
 
     def __init__(self):
         self.chain = []
-        self.transactions = []                                                  # Mempool for pending transactions
+        self.transactions = {}                                                  # Mempool: arrival number -> pending transaction, oldest first
+        self._tx_index = {}                                                     # Canonical JSON -> arrival numbers of identical pending transactions
+        self._tx_seq = itertools.count()                                        # Next arrival number
+        self._mempool_lock = threading.Lock()                                   # Request threads and the miner share the mempool
         self.nodes = set()                                                      # Set of peer nodes in the network
+        self.peer_ips = set()                                                   # Host part of each peer in nodes, for the peer-only endpoints
+        self._validated_until = 0                                               # self.chain[:_validated_until] is known to be valid
+        self._validated_hash = None                                             # block_hash of the last block covered by that watermark
 
-    def create_block(self, proof, previous_hash, merkle_root, transactions, timestamp, block_hash):
+    def create_block(self, proof, previous_hash, merkle_root, transactions, timestamp_ns, block_hash, tx_data=None):
+        if tx_data is None:
+            tx_data = _canonical_json(transactions)
         block = {
             'index': len(self.chain) + 1,
-            'timestamp': timestamp,
+            'timestamp': datetime.datetime.fromtimestamp(timestamp_ns / 1e9).isoformat(),  # For display only
+            'timestamp_ns': timestamp_ns,                                                   # Hashed
             'proof': proof,
             'previous_hash': previous_hash,
             'merkle_root': merkle_root,
             'transactions': transactions,
-            'block_hash': block_hash
+            'block_hash': block_hash,
+            '_tx_data': tx_data                                                 # Serialized transactions; reused when the block is revalidated
         }
         # Remove mined transactions from the mempool
         for tx in transactions:
-            if tx in self.transactions:
-                self.transactions.remove(tx)
+            self.remove_transaction(tx)
         self.chain.append(block)
         return block
 
     def get_merkle_root(self, transactions):
         if not transactions:
             return '0'
-        temp_transactions = [json.dumps(tx, sort_keys=True) for tx in transactions]
-        while len(temp_transactions) > 1:
-            if len(temp_transactions) % 2 != 0:
-                temp_transactions.append(temp_transactions[-1])
-            new_level = []
-            for i in range(0, len(temp_transactions), 2):
-                hash_val = hashlib.sha256(
-                    (temp_transactions[i] + temp_transactions[i + 1]).encode()
-                ).hexdigest()
-                new_level.append(hash_val)
-            temp_transactions = new_level
-        return temp_transactions[0]
+        # Each level is one contiguous buffer of raw 32-byte digests; a node is the
+        # hash of a 64-byte (left || right) slice, hex-encoded only for the root
+        level = b''.join(hashlib.sha256(_canonical_json(tx)).digest() for tx in transactions)
+        while len(level) > 32:
+            if len(level) % 64 != 0:
+                level += level[-32:]                                            # Odd node is paired with itself
+            view = memoryview(level)
+            level = b''.join(hashlib.sha256(view[i:i + 64]).digest() for i in range(0, len(level), 64))
+        return level.hex()
 
     def get_previous_block(self):
         if len(self.chain) == 0:
             return None
         return self.chain[-1]
 
-    def proof_of_work(self, block_index, timestamp, previous_hash, merkle_root, transactions):
-        tx_data = json.dumps(transactions, sort_keys=True)
-        new_proof = 0
-        check_proof = False
-        while check_proof is False:
-            hash_operation = hashlib.sha256(
-                (str(new_proof) + str(block_index) + str(timestamp) + previous_hash + merkle_root + tx_data).encode()
-            ).hexdigest()
-            if hash_operation[:3] == '000':
-                check_proof = True
-            else:
-                new_proof += 1
-        return new_proof
+    def proof_of_work(self, block_index, timestamp_ns, previous_hash, merkle_root, tx_data):
+        """Find the nonce for a block; tx_data is its transactions already serialized to bytes."""
+        # The nonce is the last field; everything before it is fixed for this block
+        prefix = b''.join(_block_prefix_parts(block_index, timestamp_ns, previous_hash, merkle_root, tx_data))
+
+        # The first work unit solves the 12-bit target about 63% of the time,
+        # so try it here before paying for inter-process hand-off
+        new_proof = _search(prefix, 0, NONCE_BATCH)
+        if new_proof is not None:
+            return new_proof
+
+        # Mining-pool style: each round gives every worker its own disjoint
+        # range of nonces. The lowest hit of a round is the nonce a
+        # sequential scan would have found.
+        pool = _get_mining_pool()
+        start = NONCE_BATCH
+        while True:
+            futures = [
+                pool.submit(_search, prefix, start + k * NONCE_BATCH, start + (k + 1) * NONCE_BATCH)
+                for k in range(MINING_WORKERS)
+            ]
+            hits = [nonce for nonce in (f.result() for f in futures) if nonce is not None]
+            if hits:
+                return min(hits)
+            start += MINING_WORKERS * NONCE_BATCH
+
+    def compute_block_digest(self, block):
+        """Recompute the raw PoW digest from block fields (see _block_prefix_parts).
+
+        The readable 'timestamp' field is not hashed. Blocks mined here carry
+        tx_data in '_tx_data'; blocks received from peers are serialized once
+        here.
+        """
+        tx_data = block.get('_tx_data') or _canonical_json(block['transactions'])
+        h = _block_hasher(block['index'], block['timestamp_ns'], block['previous_hash'], block['merkle_root'], tx_data)
+        h.update(b'%d' % block['proof'])
+        return h.digest()
 
     def compute_block_hash(self, block):
-        """Recompute the PoW hash from block fields."""
-        tx_data = json.dumps(block['transactions'], sort_keys=True)
-        return hashlib.sha256(
-            (str(block['proof']) + str(block['index']) + block['timestamp']
-             + block['previous_hash'] + block['merkle_root'] + tx_data).encode()
-        ).hexdigest()
+        """Recompute the PoW hash from block fields, hex-encoded."""
+        return self.compute_block_digest(block).hex()
 
     def is_chain_valid(self, chain):
-        if len(chain) == 0:
-            return True
-
-        first_block = chain[0]
-        if first_block['previous_hash'] != '0':
-            return False
-        if self.get_merkle_root(first_block['transactions']) != first_block['merkle_root']:
-            return False
-        computed_hash = self.compute_block_hash(first_block)
-        if computed_hash[:3] != '000':
-            return False
-        if first_block['block_hash'] != computed_hash:
-            return False
-
-        previous_block = first_block
-        block_index = 1
-        while block_index < len(chain):
+        """Validate chain; for this node's own chain only blocks past the watermark are rehashed.
+
+        The chain is append-only, so blocks validated by an earlier call stay
+        valid. Peer chains are always validated from the first block.
+        """
+        # /mine_block may append while this runs; only blocks up to end are checked and watermarked
+        end = len(chain)
+        start_index = 0
+        if chain is self.chain:
+            start_index = self._validated_until
+            # Start over if the watermarked block is no longer the one that was validated
+            if start_index and (start_index > end
+                                or chain[start_index - 1]['block_hash'] != self._validated_hash):
+                start_index = 0
+
+        for block_index in range(start_index, end):
             block = chain[block_index]
-            if block['previous_hash'] != previous_block['block_hash']:
+            if block_index == 0:
+                if block['previous_hash'] != '0':
+                    return False
+            elif block['previous_hash'] != chain[block_index - 1]['block_hash']:
                 return False
             if self.get_merkle_root(block['transactions']) != block['merkle_root']:
                 return False
-            computed_hash = self.compute_block_hash(block)
-            if computed_hash[:3] != '000':
+            digest = self.compute_block_digest(block)
+            if not _meets_target(digest):
                 return False
-            if block['block_hash'] != computed_hash:
+            # Always check the public hash: it is what peers see and what the next block links to
+            if block['block_hash'] != digest.hex():
                 return False
-            previous_block = block
-            block_index += 1
+
+        if chain is self.chain:
+            self._set_validated(chain, end)
         return True
 
+    def _set_validated(self, chain, end):
+        """Move the watermark to chain[:end], which must be validated and belong to this node's chain."""
+        self._validated_until = end
+        self._validated_hash = chain[end - 1]['block_hash'] if end else None
+
     def add_transaction(self, sender, receiver, amount):
-        self.transactions.append({
+        tx = {
             'sender': sender,
             'receiver': receiver,
             'amount': amount
-        })
+        }
+        key = _canonical_json(tx)
+        with self._mempool_lock:
+            seq = next(self._tx_seq)
+            self.transactions[seq] = tx
+            # Identical transactions share a key, so the index keeps all their arrival numbers
+            self._tx_index.setdefault(key, deque()).append(seq)
         previous_block = self.get_previous_block()
         if previous_block is None:
             return 1
         return previous_block['index'] + 1
 
+    def remove_transaction(self, tx):
+        """Remove the oldest pending copy of tx in O(1); returns False if it is not in the mempool.
+
+        Transactions match when their canonical JSON matches, so an amount of 50
+        does not match 50.0.
+        """
+        key = _canonical_json(tx)
+        with self._mempool_lock:
+            pending = self._tx_index.get(key)
+            if not pending:
+                return False
+            del self.transactions[pending.popleft()]
+            if not pending:
+                del self._tx_index[key]
+        return True
+
+    def get_pending_transactions(self, limit=None):
+        """Pending transactions as a list, oldest entry first, at most limit of them."""
+        with self._mempool_lock:
+            return list(itertools.islice(self.transactions.values(), limit))
+
     def add_node(self, address):
         """Add a peer node to the network."""
         parsed_url = urlparse(address)
         self.nodes.add(parsed_url.netloc)
+        self.peer_ips.add(parsed_url.netloc.split(':')[0])
+
+    def fetch_chain(self, node):
+        """GET a peer's chain as a list of blocks, or None if the peer is unreachable or errors."""
+        data = _get_from_peer(node, '/get_chain')
+        if data is None:
+            return None
+        chain = data.get('chain')
+        if not isinstance(chain, list) or not all(isinstance(block, dict) for block in chain):
+            return None
+        return chain
+
+    def fetch_chain_length(self, node):
+        """GET a peer's chain length from /chain_length, or None if the peer is unreachable or errors."""
+        data = _get_from_peer(node, '/chain_length')
+        length = None if data is None else data.get('length')
+        if type(length) is not int:                                             # Also rejects True/False
+            return None
+        return length
 
     def replace_chain(self):
         """Consensus: replace current chain with the longest valid chain in the network."""
-        network = self.nodes
-        longest_chain = None
-        max_length = len(self.chain)
-        for node in network:
-            try:
-                response = requests.get(f'http://{node}/get_chain')
-                if response.status_code == 200:
-                    length = response.json()['length']
-                    chain = response.json()['chain']
-                    if length > max_length and self.is_chain_valid(chain):
-                        max_length = length
-                        longest_chain = chain
-            except requests.exceptions.ConnectionError:
+        network = list(self.nodes)
+        if not network:
+            return False
+        # Ask every peer for its length first; only peers that could beat this
+        # chain are asked for the full chain, longest first
+        lengths = PEER_EXECUTOR.map(self.fetch_chain_length, network)
+        candidates = sorted(
+            ((length, node) for length, node in zip(lengths, network)
+             if length is not None and length > len(self.chain)),
+            reverse=True
+        )
+        for _, node in candidates:
+            chain = self.fetch_chain(node)
+            if chain is None:
                 continue
-        if longest_chain:
-            self.chain = longest_chain
-            return True
+            # Only blocks mined here may carry '_' fields such as '_tx_data'; drop any a peer sent
+            chain = [public_block(block) for block in chain]
+            # The peer may have changed since it reported its length, so check the chain itself
+            if len(chain) > len(self.chain) and self._is_peer_chain_valid(chain):
+                self.chain = chain
+                self._set_validated(chain, len(chain))                          # Fully validated above
+                return True
         return False
 
+    def _is_peer_chain_valid(self, chain):
+        """is_chain_valid for a chain from a peer; blocks with missing or mistyped fields make it invalid."""
+        try:
+            return self.is_chain_valid(chain)
+        except (KeyError, TypeError, AttributeError, ValueError):
+            return False
+
+    def broadcast(self, path, payload):
+        """POST payload to path on every peer in parallel; unreachable peers are skipped."""
+        return list(PEER_EXECUTOR.map(lambda node: _post_to_peer(node, path, payload), list(self.nodes)))
+
 
 # Part 2 - Flask API
 
@@ -160,6 +362,9 @@ node_address = str(uuid4()).replace('-', '')
 # Creating the Blockchain
 blockchain = Blockchain()
 
+# Held while the chain is extended or replaced; the server runs requests on several threads
+chain_lock = threading.Lock()
+
 # Preload mempool with 5 default transactions
 blockchain.add_transaction('Alice', 'Bob', 50)
 blockchain.add_transaction('Bob', 'Charlie', 30)
@@ -178,15 +383,11 @@ def add_transaction():
     index = blockchain.add_transaction(json_data['sender'], json_data['receiver'], json_data['amount'])
 
     # Broadcast the transaction to all connected peer nodes
-    for node in blockchain.nodes:
-        try:
-            requests.post(f'http://{node}/receive_transaction', json={
-                'sender': json_data['sender'],
-                'receiver': json_data['receiver'],
-                'amount': json_data['amount']
-            }, timeout=3)
-        except requests.exceptions.RequestException:
-            continue  # Skip unreachable nodes
+    blockchain.broadcast('/receive_transaction', {
+        'sender': json_data['sender'],
+        'receiver': json_data['receiver'],
+        'amount': json_data['amount']
+    })
 
     response = {
         'message': f'This transaction will be added to Block {index} and broadcast to all peers',
@@ -199,9 +400,7 @@ def add_transaction():
 # Only accepts requests from registered peer nodes
 @app.route('/receive_transaction', methods=['POST'])
 def receive_transaction():
-    # Extract IPs of all registered peer nodes
-    peer_ips = {node.split(':')[0] for node in blockchain.nodes}
-    if request.remote_addr not in peer_ips:
+    if request.remote_addr not in blockchain.peer_ips:
         return jsonify({'error': 'Forbidden: only peer nodes can call this endpoint'}), 403
     json_data = request.get_json()
     required_fields = ['sender', 'receiver', 'amount']
@@ -216,7 +415,7 @@ def receive_transaction():
 @app.route('/pending_transactions', methods=['GET'])
 def pending_transactions():
     response = {
-        'pending_transactions': blockchain.transactions,
+        'pending_transactions': blockchain.get_pending_transactions(),
         'count': len(blockchain.transactions)
     }
     return jsonify(response), 200
@@ -225,48 +424,47 @@ def pending_transactions():
 # GET /mine_block — Mine a new block (requires at least 1, takes up to 5 pending transactions)
 @app.route('/mine_block', methods=['GET'])
 def mine_block():
-    if len(blockchain.transactions) < 1:
-        return jsonify({
-            'error': 'No pending transactions to mine. Add at least 1 transaction first.'
-        }), 400
+    # One block at a time: the tip must not move between reading it and appending the new block
+    with chain_lock:
+        if len(blockchain.transactions) < 1:
+            return jsonify({
+                'error': 'No pending transactions to mine. Add at least 1 transaction first.'
+            }), 400
 
-    # Take up to 5 transactions from the mempool
-    transactions_to_mine = blockchain.transactions[:5]
+        # Take up to 5 transactions from the mempool
+        transactions_to_mine = blockchain.get_pending_transactions(5)
 
-    # Add mining reward transaction
-    blockchain.add_transaction(sender='NETWORK', receiver=node_address, amount=1)
+        # Add mining reward transaction
+        blockchain.add_transaction(sender='NETWORK', receiver=node_address, amount=1)
 
-    previous_block = blockchain.get_previous_block()
-    if previous_block is None:
-        previous_hash = '0'
-    else:
-        previous_hash = previous_block['block_hash']
-    merkle_root = blockchain.get_merkle_root(transactions_to_mine)
+        previous_block = blockchain.get_previous_block()
+        if previous_block is None:
+            previous_hash = '0'
+        else:
+            previous_hash = previous_block['block_hash']
+        merkle_root = blockchain.get_merkle_root(transactions_to_mine)
 
-    block_index = len(blockchain.chain) + 1
-    timestamp = str(datetime.datetime.now())
-    proof = blockchain.proof_of_work(block_index, timestamp, previous_hash, merkle_root, transactions_to_mine)
+        block_index = len(blockchain.chain) + 1
+        timestamp_ns = time.time_ns()
+        # Serialize the transactions once; the same bytes feed the PoW, the block hash and later revalidation
+        tx_data = _canonical_json(transactions_to_mine)
+        proof = blockchain.proof_of_work(block_index, timestamp_ns, previous_hash, merkle_root, tx_data)
 
-    tx_data = json.dumps(transactions_to_mine, sort_keys=True)
-    block_hash = hashlib.sha256(
-        (str(proof) + str(block_index) + timestamp + previous_hash + merkle_root + tx_data).encode()
-    ).hexdigest()
+        h = _block_hasher(block_index, timestamp_ns, previous_hash, merkle_root, tx_data)
+        h.update(b'%d' % proof)
+        block_hash = h.hexdigest()
 
-    block = blockchain.create_block(proof, previous_hash, merkle_root, transactions_to_mine, timestamp, block_hash)
+        block = blockchain.create_block(proof, previous_hash, merkle_root, transactions_to_mine, timestamp_ns,
+                                        block_hash, tx_data=tx_data)
 
     # Broadcast mined transactions to all peers so they remove them from their mempools
-    for node in blockchain.nodes:
-        try:
-            requests.post(f'http://{node}/sync_mempool', json={
-                'mined_transactions': transactions_to_mine
-            }, timeout=3)
-        except requests.exceptions.RequestException:
-            continue
+    blockchain.broadcast('/sync_mempool', {'mined_transactions': transactions_to_mine})
 
     response = {
         'message': 'Congratulations, you just mined a block!',
         'index': block['index'],
         'timestamp': block['timestamp'],
+        'timestamp_ns': block['timestamp_ns'],
         'nonce': block['proof'],
         'previous_hash': block['previous_hash'],
         'merkle_root': block['merkle_root'],
@@ -280,15 +478,13 @@ def mine_block():
 # Only accepts requests from registered peer nodes
 @app.route('/sync_mempool', methods=['POST'])
 def sync_mempool():
-    peer_ips = {node.split(':')[0] for node in blockchain.nodes}
-    if request.remote_addr not in peer_ips:
+    if request.remote_addr not in blockchain.peer_ips:
         return jsonify({'error': 'Forbidden: only peer nodes can call this endpoint'}), 403
     json_data = request.get_json()
     mined_transactions = json_data.get('mined_transactions', [])
     removed = 0
     for tx in mined_transactions:
-        if tx in blockchain.transactions:
-            blockchain.transactions.remove(tx)
+        if blockchain.remove_transaction(tx):
             removed += 1
     response = {
         'message': f'Mempool synced. {removed} transaction(s) removed.',
@@ -297,16 +493,27 @@ def sync_mempool():
     return jsonify(response), 200
 
 
+def public_block(block):
+    """Copy of block without the internal '_'-prefixed fields, for API responses."""
+    return {key: value for key, value in block.items() if not key.startswith('_')}
+
+
 # GET /get_chain — Get the full blockchain
 @app.route('/get_chain', methods=['GET'])
 def get_chain():
     response = {
-        'chain': blockchain.chain,
+        'chain': [public_block(block) for block in blockchain.chain],
         'length': len(blockchain.chain)
     }
     return jsonify(response), 200
 
 
+# GET /chain_length — Length of this node's chain, so peers can skip fetching a chain that cannot win
+@app.route('/chain_length', methods=['GET'])
+def chain_length():
+    return jsonify({'length': len(blockchain.chain)}), 200
+
+
 # GET /is_valid — Validate the blockchain
 @app.route('/is_valid', methods=['GET'])
 def is_valid():
@@ -339,20 +546,21 @@ def connect_node():
 # GET /replace_chain — Consensus: replace chain with the longest valid one
 @app.route('/replace_chain', methods=['GET'])
 def replace_chain():
-    is_chain_replaced = blockchain.replace_chain()
+    with chain_lock:
+        is_chain_replaced = blockchain.replace_chain()
     if is_chain_replaced:
         response = {
             'message': 'The nodes had different chains so the chain was replaced by the longest one.',
-            'new_chain': blockchain.chain
+            'new_chain': [public_block(block) for block in blockchain.chain]
         }
     else:
         response = {
             'message': 'All good. The chain is the largest one.',
-            'actual_chain': blockchain.chain
+            'actual_chain': [public_block(block) for block in blockchain.chain]
         }
     return jsonify(response), 200
 
 
 # Running the app on port 5002
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5002, debug=True)
+    app.run(host='0.0.0.0', port=5002, debug=True, threaded=True)